@@ -0,0 +1,89 @@
+"""Benchmarks for parsing GPX files of several sizes."""
+
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+from src.gpx import parse_gpx_header
+from benchmarks.utils import generate_gpx, measure
+
+# Number of bytes read from the start of a GPX file, as by the catalogue indexing command
+HEADER_BYTES = 2048
+
+# GPX 1.1 namespace used by the sample file
+GPX_NAMESPACE = "{http://www.topografix.com/GPX/1/1}"
+
+
+def parse_track_points(gpx_path: str) -> list:
+    """
+    Description
+    ----------
+    Parse track points from a GPX file by streaming through its elements.
+
+    Reference parser used only to measure GPX parsing throughput, the project does not parse track points.
+
+    Parameters
+    ----------
+    :param gpx_path: Path to the GPX file.
+
+    Returns
+    -------
+    :return: List of (latitude, longitude, elevation) tuples.
+    """
+    points = []
+    for _, element in ET.iterparse(gpx_path, events=("end",)):
+        if element.tag != f"{GPX_NAMESPACE}trkpt":
+            continue
+        elevation = element.findtext(f"{GPX_NAMESPACE}ele")
+        points.append(
+            (float(element.get("lat")), float(element.get("lon")), float(elevation) if elevation else None)
+        )
+        # Free the parsed element to keep memory usage flat
+        element.clear()
+
+    return points
+
+
+def run(scales: list, repeat: int = 3) -> list:
+    """
+    Description
+    ----------
+    Benchmark GPX header parsing with `src.gpx.parse_gpx_header` and reference track point parsing of
+    files generated from the sample GPX file.
+
+    Parameters
+    ----------
+    :param scales: Track point multipliers relative to the sample GPX file.
+    :param repeat: Number of timed runs per benchmark.
+
+    Returns
+    -------
+    :return: List of benchmark results.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as gpx_dir:
+        for scale in scales:
+            # Generate the GPX file for the current scale
+            gpx_path = os.path.join(gpx_dir, f"route_{scale}.gpx")
+            generate_gpx(scale, gpx_path)
+
+            def parse_track() -> int:
+                return len(parse_track_points(gpx_path))
+
+            result = measure(f"gpx.reference_parse_track_points[scale={scale}]", parse_track, repeat=repeat)
+            result["bytes"] = os.path.getsize(gpx_path)
+            results.append(result)
+
+        # Header parsing does not depend on the number of track points, so the sample file is used
+        gpx_path = os.path.join(gpx_dir, "route_1.gpx")
+        generate_gpx(1, gpx_path)
+        with open(gpx_path, "rb") as f:
+            header = f.read(HEADER_BYTES)
+
+        def parse_header() -> int:
+            parse_gpx_header(header)
+            return 1
+
+        results.append(measure("gpx.parse_gpx_header", parse_header, repeat=repeat))
+
+    return results
@@ -0,0 +1,62 @@
+"""Benchmarks for indexing GPX headers with ranged reads."""
+
+from src.aws.storage import S3
+from src.utils import create_random_string
+from command.index_gpx import index_object
+from benchmarks.utils import SAMPLE_GPX_PATH, measure, remove_bucket
+
+# Default number of bytes requested by the catalogue indexing command
+HEADER_BYTES = 2048
+
+
+def run(client_kwargs: dict, compressions: list, repeat: int = 3) -> list:
+    """
+    Description
+    ----------
+    Benchmark `index_object` on the sample GPX file uploaded with each compression. Raises an error if the
+    metadata cannot be read from the first HEADER_BYTES of the stored object.
+
+    Parameters
+    ----------
+    :param client_kwargs: Keyword arguments for initializing the S3 client.
+    :param compressions: Compression algorithms to upload with, None for uncompressed objects.
+    :param repeat: Number of timed runs per benchmark.
+
+    Returns
+    -------
+    :return: List of benchmark results.
+    """
+    # Initialize S3 client
+    s3_client = S3(**client_kwargs)
+
+    bucket_name = f"benchmark-index-{create_random_string(4)}"
+    s3_client.create_bucket(bucket_name)
+
+    try:
+        results = []
+        for compression in compressions:
+            object_name = f"{compression or 'raw'}/route_framed_synced.gpx"
+            s3_client.upload_file(SAMPLE_GPX_PATH, bucket_name, object_name, compression=compression)
+            obj = s3_client.client.head_object(Bucket=bucket_name, Key=object_name)
+            obj = {"Key": object_name, "Size": obj["ContentLength"], "ETag": obj["ETag"]}
+
+            # Check that a single ranged request is enough to read the metadata
+            entry, requested_bytes = index_object(s3_client, bucket_name, obj, HEADER_BYTES, HEADER_BYTES)
+            if entry["name"] is None or requested_bytes > HEADER_BYTES:
+                raise RuntimeError(
+                    f"Metadata of a {compression or 'raw'} object is not readable from the first {HEADER_BYTES} bytes."
+                )
+
+            def index() -> int:
+                index_object(s3_client, bucket_name, obj, HEADER_BYTES, HEADER_BYTES)
+                return 1
+
+            result = measure(f"s3.index_object[compression={compression}]", index, repeat=repeat)
+            result["requested_bytes"] = requested_bytes
+            result["stored_bytes"] = obj["Size"]
+            results.append(result)
+    finally:
+        # Remove the benchmark objects so runs against LocalStack do not leave them behind
+        remove_bucket(s3_client, bucket_name)
+
+    return results
@@ -0,0 +1,63 @@
+"""Benchmarks for parsing S3 notifications from CloudWatch log events."""
+
+import time
+
+from src.aws.storage import CloudWatch
+from src.utils import create_random_string
+from benchmarks.utils import create_s3_event_message, measure
+
+# Maximum number of events accepted by a single put_log_events call
+PUT_LOG_EVENTS_LIMIT = 10000
+
+
+def run(client_kwargs: dict, sizes: list, records_per_event: int = 1, repeat: int = 3) -> list:
+    """
+    Description
+    ----------
+    Benchmark `CloudWatch.get_log_events` over synthetic pages of S3 notification log events.
+
+    Parameters
+    ----------
+    :param client_kwargs: Keyword arguments for initializing the CloudWatch client.
+    :param sizes: Numbers of log events to parse. At most 2500, as the client reads a single page.
+    :param records_per_event: Number of S3 records in each log event.
+    :param repeat: Number of timed runs per benchmark.
+
+    Returns
+    -------
+    :return: List of benchmark results.
+    """
+    # Initialize CloudWatch client
+    logs_client = CloudWatch(**client_kwargs)
+
+    log_group_name = f"/aws/lambda/benchmark-{create_random_string(4)}"
+    logs_client.create_log_group(log_group_name)
+
+    results = []
+    for size in sizes:
+        log_stream_name = f"benchmark-{size}"
+        logs_client.create_log_stream(log_group_name, log_stream_name)
+
+        # Create synthetic log events with the same shape as the Lambda function output
+        timestamp = int(time.time() * 1000)
+        events = []
+        for index in range(size):
+            keys = [f"{create_random_string(10)}%5Croute_framed_synced.gpx" for _ in range(records_per_event)]
+            message = create_s3_event_message("benchmark-bucket", keys, start=index * records_per_event)
+            events.append({"timestamp": timestamp + index, "message": message})
+
+        # Put the log events in batches
+        for start in range(0, len(events), PUT_LOG_EVENTS_LIMIT):
+            logs_client.client.put_log_events(
+                logGroupName=log_group_name,
+                logStreamName=log_stream_name,
+                logEvents=events[start : start + PUT_LOG_EVENTS_LIMIT],
+            )
+
+        def parse() -> int:
+            # Events count is multiplied inside the client, so the whole stream fits into a single page
+            return len(logs_client.get_log_events(log_group_name, log_stream_name, earliest=True, events_count=size))
+
+        results.append(measure(f"cloudwatch.get_log_events[n={size},records={records_per_event}]", parse, repeat))
+
+    return results
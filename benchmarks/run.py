@@ -0,0 +1,186 @@
+"""This script runs the benchmark suite and compares the results against a stored baseline."""
+
+import os
+import sys
+import importlib.util
+import argparse
+
+from src.decorators import load_env
+from benchmarks import gpx_parsing, indexing, log_parsing, s3_transfer
+from benchmarks.utils import aws_environment, compare_results, load_results, save_results
+
+# Define the benchmarks directory
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+@load_env
+def main(
+    suites: list,
+    s3_sizes: list,
+    log_sizes: list,
+    gpx_scales: list,
+    repeat: int,
+    compression: str,
+    localstack: bool,
+    output: str,
+    baseline: str,
+    save_baseline: bool,
+    tolerance: float,
+) -> int:
+    """
+    Description
+    ----------
+    Main function to run the benchmarks and compare them against the baseline.
+
+    Parameters
+    ----------
+    :param suites: Benchmark suites to run ('s3', 'logs', 'gpx', 'index').
+    :param s3_sizes: Numbers of objects for the S3 transfer benchmarks.
+    :param log_sizes: Numbers of log events for the CloudWatch parsing benchmarks.
+    :param gpx_scales: Track point multipliers for the GPX parsing benchmarks.
+    :param repeat: Number of timed runs per benchmark.
+    :param compression: Compression algorithm for the S3 transfer benchmarks ('gzip' or 'zstd').
+    :param localstack: If True, runs against LocalStack at AWS_ENDPOINT_URL; otherwise, AWS is mocked with moto.
+    :param output: Path to the JSON file to write the results to.
+    :param baseline: Path to the baseline JSON file.
+    :param save_baseline: If True, stores the results as the new baseline.
+    :param tolerance: Allowed relative slowdown before a benchmark is reported as a regression.
+
+    Returns
+    ----------
+    :return: Exit code, 1 if any benchmark regressed against the baseline; otherwise, 0.
+    """
+    # Define the endpoint URL, None means the in-process moto mock is used
+    endpoint_url = os.getenv("AWS_ENDPOINT_URL") if localstack else None
+
+    # Create placeholder for the results
+    results = []
+
+    with aws_environment(endpoint_url) as client_kwargs:
+        if "s3" in suites:
+            results += s3_transfer.run(client_kwargs, s3_sizes, repeat=1, compression=compression)
+        if "logs" in suites:
+            results += log_parsing.run(client_kwargs, log_sizes, repeat=repeat)
+        if "index" in suites:
+            # zstd compression is only checked if the optional zstandard package is installed
+            compressions = [None, "gzip"] + (["zstd"] if importlib.util.find_spec("zstandard") else [])
+            results += indexing.run(client_kwargs, compressions, repeat=repeat)
+    if "gpx" in suites:
+        results += gpx_parsing.run(gpx_scales, repeat=repeat)
+
+    # Write the results in machine-readable form
+    save_results(output, results)
+    print(f"Results written to {output}.")
+
+    if save_baseline:
+        save_results(baseline, results)
+        print(f"Baseline written to {baseline}.")
+        return 0
+
+    # Compare the results against the baseline
+    comparisons = compare_results(results, load_results(baseline), tolerance=tolerance)
+    results_by_name = {result["name"]: result for result in results}
+    for comparison in comparisons:
+        result = results_by_name[comparison["name"]]
+        ratio = f"{comparison['ratio']:.2f}x" if comparison["ratio"] is not None else "-"
+        print(
+            f"{comparison['name']:<55} {result['best']:>10.4f}s {result['seconds_per_item'] * 1e6:>10.2f}us/item "
+            f"{ratio:>8} {comparison['status']}"
+        )
+
+    regressions = [comparison for comparison in comparisons if comparison["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {tolerance:.0%}.")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run benchmarks.")
+    parser.add_argument(
+        "--suites",
+        nargs="+",
+        choices=["s3", "logs", "gpx", "index"],
+        default=["s3", "logs", "gpx", "index"],
+        help="Benchmark suites to run.",
+    )
+    parser.add_argument(
+        "--s3_sizes",
+        nargs="+",
+        type=int,
+        default=[1000],
+        help="Numbers of objects for the S3 transfer benchmarks (e.g. 1000 10000 100000).",
+    )
+    parser.add_argument(
+        "--log_sizes",
+        nargs="+",
+        type=int,
+        default=[100, 1000, 2500],
+        help="Numbers of log events for the CloudWatch parsing benchmarks.",
+    )
+    parser.add_argument(
+        "--gpx_scales",
+        nargs="+",
+        type=float,
+        default=[0.25, 1, 4, 16],
+        help="Track point multipliers relative to the sample GPX file.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed runs per benchmark. S3 transfer benchmarks always run once.",
+    )
+    parser.add_argument(
+        "--compression",
+        type=str,
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Compress objects in the S3 transfer benchmarks with the given algorithm.",
+    )
+    parser.add_argument(
+        "--localstack",
+        action="store_true",
+        help="Run against LocalStack at AWS_ENDPOINT_URL instead of the in-process moto mock.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=os.path.join(BENCHMARKS_PATH, "results.json"),
+        help="Path to the JSON file to write the results to.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=os.path.join(BENCHMARKS_PATH, "baseline.json"),
+        help="Path to the baseline JSON file.",
+    )
+    parser.add_argument(
+        "--save_baseline",
+        action="store_true",
+        help="Store the results as the new baseline.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative slowdown before a benchmark is reported as a regression.",
+    )
+
+    args = parser.parse_args()
+    sys.exit(
+        main(
+            suites=args.suites,
+            s3_sizes=args.s3_sizes,
+            log_sizes=args.log_sizes,
+            gpx_scales=args.gpx_scales,
+            repeat=args.repeat,
+            compression=args.compression,
+            localstack=args.localstack,
+            output=args.output,
+            baseline=args.baseline,
+            save_baseline=args.save_baseline,
+            tolerance=args.tolerance,
+        )
+    )
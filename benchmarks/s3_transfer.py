@@ -0,0 +1,69 @@
+"""Benchmarks for S3 upload, download and listing throughput."""
+
+import os
+import tempfile
+
+from src.aws.storage import S3
+from src.utils import create_random_string
+from benchmarks.utils import SAMPLE_GPX_PATH, measure, remove_bucket
+
+
+def run(client_kwargs: dict, sizes: list, repeat: int = 1, compression: str = None) -> list:
+    """
+    Description
+    ----------
+    Benchmark `S3.upload_file`, `S3.list_files` and `S3.download_file` for several object counts.
+
+    Parameters
+    ----------
+    :param client_kwargs: Keyword arguments for initializing the S3 client.
+    :param sizes: Numbers of objects to transfer.
+    :param repeat: Number of timed runs per benchmark.
+    :param compression: Compression algorithm for uploaded objects ('gzip' or 'zstd').
+
+    Returns
+    -------
+    :return: List of benchmark results.
+    """
+    # Initialize S3 client
+    s3_client = S3(**client_kwargs)
+
+    # Mark compressed runs so they are not compared against uncompressed baselines
+    suffix = f",compression={compression}" if compression else ""
+
+    results = []
+    for size in sizes:
+        # Use a fresh bucket per size so listings only contain the benchmarked objects
+        bucket_name = f"benchmark-{size}-{create_random_string(4)}"
+        s3_client.create_bucket(bucket_name)
+
+        try:
+            # Define object names the same way as the setup command does
+            object_names = [os.path.join(create_random_string(10), "route_framed_synced.gpx") for _ in range(size)]
+
+            def upload() -> int:
+                for object_name in object_names:
+                    s3_client.upload_file(SAMPLE_GPX_PATH, bucket_name, object_name, compression=compression)
+                return len(object_names)
+
+            def list_files() -> int:
+                return len(s3_client.list_files(bucket_name))
+
+            results.append(measure(f"s3.upload_file[n={size}{suffix}]", upload, repeat=repeat, warmup=False))
+            results.append(measure(f"s3.list_files[n={size}{suffix}]", list_files, repeat=repeat, warmup=False))
+
+            with tempfile.TemporaryDirectory() as download_dir:
+
+                def download() -> int:
+                    for object_name in object_names:
+                        download_path = os.path.join(download_dir, object_name)
+                        os.makedirs(os.path.dirname(download_path), exist_ok=True)
+                        s3_client.download_file(bucket_name, object_name, download_path)
+                    return len(object_names)
+
+                results.append(measure(f"s3.download_file[n={size}{suffix}]", download, repeat=repeat, warmup=False))
+        finally:
+            # Remove the benchmark objects so runs against LocalStack do not leave them behind
+            remove_bucket(s3_client, bucket_name)
+
+    return results
@@ -0,0 +1,274 @@
+"""Shared helpers for the benchmark suite."""
+
+import json
+import os
+import re
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+# Sample GPX file used as a template for generated data
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_GPX_PATH = os.path.join(PROJECT_PATH, "data", "route_framed_synced.gpx")
+
+# Pattern matching a single track point including its children
+TRKPT_PATTERN = re.compile(r"\s*<trkpt\b.*?</trkpt>", re.DOTALL)
+
+
+def measure(name: str, func: Callable[[], int], repeat: int = 3, warmup: bool = True, min_time: float = 0.2) -> dict:
+    """
+    Description
+    ----------
+    Run a benchmark function several times and collect timing statistics.
+
+    Each timed run calls the function in a loop until at least min_time seconds have passed, as
+    `timeit.Timer.autorange` does, so short calls are not dominated by timer resolution and noise.
+
+    Parameters
+    ----------
+    :param name: Unique benchmark name used to match results against the baseline.
+    :param func: Function to benchmark. Must return the number of items it processed.
+    :param repeat: Number of timed runs.
+    :param warmup: If True, runs the function once before timing to warm up caches and connections.
+    :param min_time: Minimum duration of a timed run in seconds.
+
+    Returns
+    -------
+    :return: Dictionary with the benchmark name, item count and timings in seconds.
+    """
+    # Create placeholders for timings per call and processed items
+    timings = []
+    items = 0
+
+    if warmup:
+        func()
+
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            items = func()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        timings.append(elapsed / loops)
+
+    # Use the best run as the headline number since it is the least affected by noise
+    best = min(timings)
+
+    return {
+        "name": name,
+        "items": items,
+        "repeat": repeat,
+        "best": best,
+        "median": statistics.median(timings),
+        "seconds_per_item": best / items if items else best,
+        "items_per_second": items / best if best else 0.0,
+    }
+
+
+def compare_results(results: list, baseline: list, tolerance: float = 0.2) -> list:
+    """
+    Description
+    ----------
+    Compare benchmark results against a stored baseline.
+
+    Parameters
+    ----------
+    :param results: List of benchmark results produced by `measure`.
+    :param baseline: List of baseline benchmark results. Results without a matching name or recorded
+        before time per item was reported are marked as new.
+    :param tolerance: Allowed relative slowdown before a result is marked as a regression.
+
+    Returns
+    -------
+    :return: List of comparison records, one per result.
+    """
+    # Index baseline results by benchmark name
+    baseline_by_name = {result["name"]: result for result in baseline}
+
+    comparisons = []
+    for result in results:
+        reference = baseline_by_name.get(result["name"])
+        # Benchmarks missing from the baseline cannot be compared
+        if reference is None or "seconds_per_item" not in reference:
+            comparisons.append({"name": result["name"], "ratio": None, "status": "new"})
+            continue
+        # Ratio above 1 means the benchmark got slower per processed item
+        reference_time = reference["seconds_per_item"]
+        ratio = result["seconds_per_item"] / reference_time if reference_time else float("inf")
+        if ratio > 1 + tolerance:
+            status = "regression"
+        elif ratio < 1 - tolerance:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        comparisons.append({"name": result["name"], "ratio": ratio, "status": status})
+
+    return comparisons
+
+
+def load_results(path: str) -> list:
+    """
+    Description
+    ----------
+    Load benchmark results from a JSON file.
+
+    Parameters
+    ----------
+    :param path: Path to the JSON file.
+
+    Returns
+    -------
+    :return: List of benchmark results, empty if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def save_results(path: str, results: list) -> None:
+    """
+    Description
+    ----------
+    Save benchmark results to a JSON file.
+
+    Parameters
+    ----------
+    :param path: Path to the JSON file.
+    :param results: List of benchmark results.
+    """
+    with open(path, "w") as f:
+        json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "results": results}, f, indent=2)
+        f.write("\n")
+
+
+def generate_gpx(scale: float, output_path: str, template_path: str = SAMPLE_GPX_PATH) -> int:
+    """
+    Description
+    ----------
+    Generate a GPX file by scaling the number of track points of a template file.
+
+    Parameters
+    ----------
+    :param scale: Multiplier for the number of track points (e.g. 0.5 halves, 4 quadruples them).
+    :param output_path: Path of the generated GPX file.
+    :param template_path: Path to the template GPX file.
+
+    Returns
+    -------
+    :return: Number of track points in the generated file.
+    """
+    with open(template_path, "r", encoding="utf-8") as f:
+        template = f.read()
+
+    # Split the template into the header, track points and footer
+    points = TRKPT_PATTERN.findall(template)
+    head = template[: template.find(points[0])]
+    tail = template[template.rfind(points[-1]) + len(points[-1]) :]
+
+    # Repeat or truncate the track points to match the requested scale
+    count = max(1, int(len(points) * scale))
+    scaled_points = (points * (count // len(points) + 1))[:count]
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(head)
+        f.writelines(scaled_points)
+        f.write(tail)
+
+    return count
+
+
+def create_s3_event_message(bucket_name: str, keys: list, start: int = 0) -> str:
+    """
+    Description
+    ----------
+    Create a synthetic S3 notification message as logged by the Lambda function.
+
+    Parameters
+    ----------
+    :param bucket_name: Name of the bucket in the notification.
+    :param keys: Object keys to include as records.
+    :param start: Offset used to generate unique sequencers.
+
+    Returns
+    -------
+    :return: JSON encoded S3 notification event.
+    """
+    records = []
+    for index, key in enumerate(keys, start=start):
+        records.append(
+            {
+                "eventVersion": "2.1",
+                "eventSource": "aws:s3",
+                "awsRegion": "us-east-1",
+                "eventTime": "2025-07-21T10:00:00.000Z",
+                "eventName": "ObjectCreated:Put",
+                "s3": {
+                    "s3SchemaVersion": "1.0",
+                    "bucket": {"name": bucket_name, "arn": f"arn:aws:s3:::{bucket_name}"},
+                    "object": {
+                        "key": key,
+                        "size": 380175,
+                        "eTag": "5f0e2b5c3b7d4b1f9a0c6c1e2d3f4a5b",
+                        "sequencer": f"{index:016X}",
+                    },
+                },
+            }
+        )
+
+    return json.dumps({"Records": records})
+
+
+@contextmanager
+def aws_environment(endpoint_url: str = None) -> Iterator[dict]:
+    """
+    Description
+    ----------
+    Provide client settings for either an in-process moto mock or a running LocalStack instance.
+
+    Parameters
+    ----------
+    :param endpoint_url: LocalStack endpoint URL. If not specified, AWS is mocked in-process with moto.
+
+    Yields
+    -------
+    :return: Keyword arguments for initializing the project AWS clients.
+    """
+    client_kwargs = {
+        "endpoint_url": endpoint_url,
+        "aws_access_key_id": "test",
+        "aws_secret_access_key": "test",
+        "region_name": "us-east-1",
+    }
+
+    # Use the running LocalStack instance if an endpoint is provided
+    if endpoint_url:
+        yield client_kwargs
+        return
+
+    from moto import mock_aws
+
+    with mock_aws():
+        yield client_kwargs
+
+
+def remove_bucket(s3_client, bucket_name: str) -> None:
+    """
+    Description
+    ----------
+    Delete all objects of a benchmark bucket and the bucket itself.
+
+    Parameters
+    ----------
+    :param s3_client: S3 client of the project.
+    :param bucket_name: Name of the bucket to remove.
+    """
+    _, errors = s3_client.delete_files(bucket_name)
+    if errors:
+        print(f"Failed to delete {len(errors)} objects, bucket '{bucket_name}' is left in place.")
+        return
+    s3_client.delete_bucket(bucket_name)
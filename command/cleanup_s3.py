@@ -0,0 +1,167 @@
+"""This script deletes files from AWS S3 in batches and optionally sets up server-side expiry."""
+
+import os
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from src.decorators import load_env
+from src.aws.storage import S3
+
+
+def delete_files(
+    s3_client: S3, bucket_name: str, prefix: str, older_than_days: int, pattern: str, workers: int, dry_run: bool
+) -> None:
+    """
+    Description
+    ----------
+    Delete matching files from an S3 bucket and report the result.
+
+    Parameters
+    ----------
+    :param s3_client: S3 client used to delete the files.
+    :param bucket_name: Name of the S3 bucket to clean up.
+    :param prefix: Only objects with keys starting with this prefix are deleted.
+    :param older_than_days: Only objects last modified more than this number of days ago are deleted.
+    :param pattern: Only objects with keys matching this glob pattern are deleted.
+    :param workers: Number of concurrent delete_objects requests.
+    :param dry_run: If True, only lists the matching objects without deleting them.
+    """
+    # Define the cutoff time for the age filter
+    older_than = None
+    if older_than_days is not None:
+        older_than = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+
+    # List matching files without deleting them
+    if dry_run:
+        matched_count = 0
+        for obj in s3_client.iter_matching_objects(bucket_name, prefix=prefix, older_than=older_than, pattern=pattern):
+            print(f"Would delete {obj['Key']}")
+            matched_count += 1
+        print(f"Dry run: {matched_count} files would be deleted from bucket '{bucket_name}'.")
+        return
+
+    # Delete matching files
+    matched_count, errors = s3_client.delete_files(
+        bucket_name, prefix=prefix, older_than=older_than, pattern=pattern, workers=workers
+    )
+
+    print(f"Deleted {matched_count - len(errors)} of {matched_count} files from bucket '{bucket_name}'.")
+    for error in errors:
+        print(f"Failed to delete {error['Key']}: {error['Code']} {error['Message']}")
+
+
+@load_env
+def main(
+    bucket_name: str,
+    prefix: str = "",
+    older_than_days: int = None,
+    pattern: str = None,
+    workers: int = 4,
+    dry_run: bool = False,
+    expiration_days: int = None,
+    delete: bool = True,
+) -> None:
+    """
+    Description
+    ----------
+    Main function to delete matching files from an S3 bucket.
+
+    Parameters
+    ----------
+    :param bucket_name: Name of the S3 bucket to clean up.
+    :param prefix: Only objects with keys starting with this prefix are deleted.
+    :param older_than_days: Only objects last modified more than this number of days ago are deleted.
+    :param pattern: Only objects with keys matching this glob pattern are deleted.
+    :param workers: Number of concurrent delete_objects requests.
+    :param dry_run: If True, only lists the matching objects without deleting them.
+    :param expiration_days: If specified, installs a lifecycle rule expiring objects under prefix after these days.
+    :param delete: If False, skips deleting files, e.g. to only install the lifecycle rule.
+    """
+    # Define credentials and endpoint URL
+    ENDPOINT_URL = os.getenv("AWS_ENDPOINT_URL")
+    AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
+    AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
+    AWS_REGION = os.getenv("AWS_REGION")
+
+    # Initialize S3 client
+    s3_client = S3(
+        endpoint_url=ENDPOINT_URL,
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        region_name=AWS_REGION,
+    )
+
+    if delete:
+        delete_files(s3_client, bucket_name, prefix, older_than_days, pattern, workers, dry_run)
+
+    # Install the lifecycle rule so the remaining files expire server-side
+    if expiration_days is not None:
+        rule_id = f"expire-{prefix or 'all'}"
+        if dry_run:
+            print(f"Dry run: lifecycle rule '{rule_id}' would expire files after {expiration_days} days.")
+        else:
+            s3_client.put_expiration_rule(bucket_name, rule_id, expiration_days, prefix=prefix)
+            print(f"Lifecycle rule '{rule_id}' expires files after {expiration_days} days.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete files from an S3 bucket.")
+    parser.add_argument(
+        "--bucket_name",
+        type=str,
+        default="gpx-bucket-aws-test",
+        help="Name of the S3 bucket to clean up.",
+    )
+    parser.add_argument(
+        "--prefix",
+        type=str,
+        default="",
+        help="Only delete objects with keys starting with this prefix.",
+    )
+    parser.add_argument(
+        "--older_than_days",
+        type=int,
+        default=None,
+        help="Only delete objects last modified more than this number of days ago.",
+    )
+    parser.add_argument(
+        "--pattern",
+        type=str,
+        default=None,
+        help="Only delete objects with keys matching this glob pattern (e.g. '*/route_framed_synced.gpx').",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of concurrent delete_objects requests.",
+    )
+    parser.add_argument(
+        "--dry_run",
+        action="store_true",
+        help="Only list the matching objects without deleting them.",
+    )
+    parser.add_argument(
+        "--expiration_days",
+        type=int,
+        default=None,
+        help="Install a lifecycle rule expiring objects under prefix after this number of days.",
+    )
+    parser.add_argument(
+        "--no_delete",
+        dest="delete",
+        action="store_false",
+        help="Skip deleting files, e.g. to only install the lifecycle rule.",
+    )
+
+    args = parser.parse_args()
+    main(
+        bucket_name=args.bucket_name,
+        prefix=args.prefix,
+        older_than_days=args.older_than_days,
+        pattern=args.pattern,
+        workers=args.workers,
+        dry_run=args.dry_run,
+        expiration_days=args.expiration_days,
+        delete=args.delete,
+    )
@@ -72,9 +72,9 @@ def main(
     print("GPX Files in Log Stream:")
     for gpx_file in tqdm(gpx_files, desc="Processing GPX files", total=len(gpx_files)):
         # Get the filename name
-        file_name = gpx_file.get("filename")
+        file_name = gpx_file.key
         # Get file name and bucket name
-        bucket_name = gpx_file.get("bucket")
+        bucket_name = gpx_file.bucket
         # Define the download path
         download_path = os.path.join(download_dir, file_name)
         # Define subdirectory for gpx file
@@ -0,0 +1,217 @@
+"""This script indexes GPX files in AWS S3 into a local SQLite catalogue by reading only their headers."""
+
+import os
+import argparse
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
+from tqdm import tqdm
+from botocore.exceptions import BotoCoreError, ClientError
+
+from src.decorators import load_env
+from src.aws.storage import S3
+from src.catalogue import get_indexed_etags, open_catalogue, save_entries
+from src.compression import DECOMPRESSION_ERRORS
+from src.gpx import parse_gpx_header
+
+# Number of objects indexed before the results are saved to the catalogue
+BATCH_SIZE = 1000
+
+# Errors of a single object which are reported without stopping the run
+INDEX_ERRORS = (ClientError, BotoCoreError) + DECOMPRESSION_ERRORS
+
+
+def index_object(s3_client: S3, bucket_name: str, obj: dict, header_bytes: int, max_header_bytes: int) -> tuple:
+    """
+    Description
+    ----------
+    Read the header of a GPX object and build its catalogue entry.
+
+    Parameters
+    ----------
+    :param s3_client: S3 client used to read the object header.
+    :param bucket_name: Name of the bucket containing the object.
+    :param obj: Object description from the bucket listing.
+    :param header_bytes: Number of bytes requested first.
+    :param max_header_bytes: Maximum number of bytes requested if the metadata does not fit into the first request.
+
+    Returns
+    -------
+    :return: Tuple of the catalogue entry and the number of bytes requested over all ranged requests.
+    """
+    # Request more bytes until the whole metadata block is read, empty files have nothing to read
+    header = None
+    requested_bytes = 0
+    range_bytes = header_bytes if obj["Size"] else 0
+    while range_bytes:
+        data = s3_client.read_file_header(bucket_name, obj["Key"], range_bytes)
+        requested_bytes += min(range_bytes, obj["Size"])
+        header = parse_gpx_header(data)
+        if header is not None or range_bytes >= obj["Size"] or range_bytes >= max_header_bytes:
+            break
+        range_bytes = min(range_bytes * 2, max_header_bytes)
+
+    # Empty files and files without a metadata block are catalogued with empty fields
+    header = header or {"creator": None, "name": None, "time": None, "description": None}
+
+    entry = {"bucket": bucket_name, "key": obj["Key"], "size": obj["Size"], "etag": obj["ETag"].strip('"'), **header}
+
+    return entry, requested_bytes
+
+
+def try_index_object(s3_client: S3, bucket_name: str, obj: dict, header_bytes: int, max_header_bytes: int) -> tuple:
+    """
+    Description
+    ----------
+    Index a GPX object, reporting failures instead of raising them so one object does not stop the run.
+
+    Parameters
+    ----------
+    :param s3_client: S3 client used to read the object header.
+    :param bucket_name: Name of the bucket containing the object.
+    :param obj: Object description from the bucket listing.
+    :param header_bytes: Number of bytes requested first.
+    :param max_header_bytes: Maximum number of bytes requested if the metadata does not fit into the first request.
+
+    Returns
+    -------
+    :return: Tuple of the catalogue entry and the number of bytes requested, or (None, 0) if indexing failed.
+    """
+    try:
+        return index_object(s3_client, bucket_name, obj, header_bytes, max_header_bytes)
+    except INDEX_ERRORS as error:
+        # Failed objects are not catalogued, so they are retried by the next run
+        print(f"Failed to index {obj['Key']}: {error}")
+        return None, 0
+
+
+@load_env
+def main(
+    bucket_name: str,
+    catalogue_path: str,
+    prefix: str = "",
+    header_bytes: int = 2048,
+    max_header_bytes: int = 65536,
+    workers: int = 10,
+    reindex: bool = False,
+) -> None:
+    """
+    Description
+    ----------
+    Main function to index GPX files in an S3 bucket into a SQLite catalogue.
+
+    Parameters
+    ----------
+    :param bucket_name: Name of the S3 bucket to index.
+    :param catalogue_path: Path to the SQLite catalogue file.
+    :param prefix: Only objects with keys starting with this prefix are indexed.
+    :param header_bytes: Number of bytes requested from the start of each GPX file.
+    :param max_header_bytes: Maximum number of bytes requested if the metadata does not fit into header_bytes.
+    :param workers: Number of concurrent ranged requests.
+    :param reindex: If True, indexes all files; otherwise, skips files already catalogued with the same ETag.
+    """
+    # Define credentials and endpoint URL
+    ENDPOINT_URL = os.getenv("AWS_ENDPOINT_URL")
+    AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
+    AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
+    AWS_REGION = os.getenv("AWS_REGION")
+
+    # Initialize S3 client
+    s3_client = S3(
+        endpoint_url=ENDPOINT_URL,
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        region_name=AWS_REGION,
+    )
+
+    # Open the catalogue and get already indexed files
+    connection = open_catalogue(catalogue_path)
+    indexed_etags = {} if reindex else get_indexed_etags(connection, bucket_name)
+
+    # Select GPX files which are new or changed since the last run
+    objects = (
+        obj
+        for obj in s3_client.iter_objects(bucket_name, prefix=prefix)
+        if obj["Key"].lower().endswith(".gpx") and indexed_etags.get(obj["Key"]) != obj["ETag"].strip('"')
+    )
+
+    # Create placeholders for statistics
+    indexed_count = 0
+    requested_bytes = 0
+    total_bytes = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, tqdm(desc="Indexing GPX files") as progress:
+        # Index the listing in batches to keep memory usage bounded for large buckets
+        while batch := list(islice(objects, BATCH_SIZE)):
+            results = list(
+                executor.map(
+                    lambda obj: try_index_object(s3_client, bucket_name, obj, header_bytes, max_header_bytes), batch
+                )
+            )
+            entries = [entry for entry, _ in results if entry is not None]
+            save_entries(connection, entries)
+
+            indexed_count += len(entries)
+            requested_bytes += sum(bytes_read for _, bytes_read in results)
+            total_bytes += sum(obj["Size"] for obj in batch)
+            progress.update(len(batch))
+
+    connection.close()
+    print(f"Indexed {indexed_count} GPX files into {catalogue_path}.")
+    print(f"Requested {requested_bytes} bytes out of {total_bytes} bytes stored.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Index GPX files in S3 into a SQLite catalogue.")
+    parser.add_argument(
+        "--bucket_name",
+        type=str,
+        default="gpx-bucket-aws-test",
+        help="Name of the S3 bucket to index.",
+    )
+    parser.add_argument(
+        "--catalogue_path",
+        type=str,
+        default="gpx_catalogue.sqlite",
+        help="Path to the SQLite catalogue file.",
+    )
+    parser.add_argument(
+        "--prefix",
+        type=str,
+        default="",
+        help="Only index objects with keys starting with this prefix.",
+    )
+    parser.add_argument(
+        "--header_bytes",
+        type=int,
+        default=2048,
+        help="Number of bytes requested from the start of each GPX file.",
+    )
+    parser.add_argument(
+        "--max_header_bytes",
+        type=int,
+        default=65536,
+        help="Maximum number of bytes requested if the metadata does not fit into header_bytes.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=10,
+        help="Number of concurrent ranged requests.",
+    )
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Index all files, including those already catalogued with the same ETag.",
+    )
+
+    args = parser.parse_args()
+    main(
+        bucket_name=args.bucket_name,
+        catalogue_path=args.catalogue_path,
+        prefix=args.prefix,
+        header_bytes=args.header_bytes,
+        max_header_bytes=args.max_header_bytes,
+        workers=args.workers,
+        reindex=args.reindex,
+    )
@@ -12,7 +12,7 @@ from src.aws.storage import S3, IAM, Lambda
 
 
 @load_env
-def main(bucket_name: str, function_name: str, role_name: str) -> None:
+def main(bucket_name: str, function_name: str, role_name: str, compression: str = None) -> None:
     """
     Description
     ----------
@@ -23,6 +23,7 @@ def main(bucket_name: str, function_name: str, role_name: str) -> None:
     :param bucket_name: Name of the S3 bucket to create.
     :param function_name: Name of the Lambda function to create.
     :param role_name: Name of the IAM role for the Lambda function.
+    :param compression: Compression algorithm for uploaded GPX files ('gzip' or 'zstd'), uncompressed if not specified.
     """
     # Define the current working directory
     current_path = os.getcwd()
@@ -107,7 +108,7 @@ def main(bucket_name: str, function_name: str, role_name: str) -> None:
         # Upload the GPX file to S3
         upload_gpx_path = os.path.join(random_string, f"route_framed_synced.gpx")
         # Upload the file to the S3 bucket
-        s3_client.upload_file(gpx_path, bucket_name, upload_gpx_path)
+        s3_client.upload_file(gpx_path, bucket_name, upload_gpx_path, compression=compression)
 
 
 if __name__ == "__main__":
@@ -130,10 +131,18 @@ if __name__ == "__main__":
         default="gpx_lambda_role",
         help="Name of the IAM role for the Lambda function.",
     )
+    parser.add_argument(
+        "--compression",
+        type=str,
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Compress uploaded GPX files with the given algorithm.",
+    )
     args = parser.parse_args()
 
     main(
         bucket_name=args.bucket_name,
         function_name=args.function_name,
         role_name=args.role_name,
+        compression=args.compression,
     )
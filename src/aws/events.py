@@ -0,0 +1,157 @@
+"""This module parses S3 event notifications logged by the Lambda function."""
+
+from typing import NamedTuple
+from urllib.parse import unquote_plus
+
+# Use the faster orjson backend if it is installed
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    json_loads = json.loads
+
+# Percent escapes of ASCII characters in both hex cases, e.g. '5C' and '5c' for a backslash
+ASCII_ESCAPES = {f"{code:02x}": chr(code) for code in range(128)} | {f"{code:02X}": chr(code) for code in range(128)}
+
+
+class S3Event(NamedTuple):
+    """
+    Description:
+    ------------
+    Compact record of an S3 object notification.
+
+    Attributes:
+    -----------
+    :param bucket: Name of the bucket containing the object.
+    :param key: URL-decoded S3 object key.
+    :param size: Size of the object in bytes.
+    :param etag: ETag of the object.
+    :param event_time: Time of the event in ISO 8601 format.
+    :param sequencer: Hex string ordering events for the same object key.
+    """
+
+    bucket: str
+    key: str
+    size: int
+    etag: str
+    event_time: str
+    sequencer: str
+
+
+def parse_s3_events(message: str) -> list:
+    """
+    Description:
+    ------------
+    Parse S3 object records from a logged S3 event notification.
+
+    Parameters:
+    -----------
+    :param message: JSON encoded S3 event notification.
+
+    Returns:
+    --------
+    :return: List of S3 events.
+    """
+    # Create placeholder for S3 events
+    s3_events = []
+
+    for record in json_loads(message).get("Records", []):
+        s3 = record.get("s3")
+        if s3 is None:
+            continue
+        obj = s3["object"]
+        # Positional arguments are faster to construct than keyword arguments
+        s3_events.append(
+            S3Event(
+                s3["bucket"]["name"],
+                _decode_key(obj["key"]),
+                obj.get("size", 0),
+                obj.get("eTag", ""),
+                record["eventTime"],
+                obj.get("sequencer", ""),
+            )
+        )
+
+    return s3_events
+
+
+def deduplicate_s3_events(s3_events: list) -> list:
+    """
+    Description:
+    ------------
+    Collapse repeated notifications for the same object to the latest one by sequencer.
+
+    Parameters:
+    -----------
+    :param s3_events: List of S3 events.
+
+    Returns:
+    --------
+    :return: List of S3 events with one event per object, in the order objects were first seen.
+    """
+    # Index the latest event and its sequencer value by bucket and key
+    latest_events = {}
+    for s3_event in s3_events:
+        object_id = (s3_event.bucket, s3_event.key)
+        sequencer = _sequencer_value(s3_event.sequencer)
+        latest_event = latest_events.get(object_id)
+        if latest_event is None or sequencer > latest_event[0]:
+            latest_events[object_id] = (sequencer, s3_event)
+
+    return [s3_event for _, s3_event in latest_events.values()]
+
+
+def _sequencer_value(sequencer: str) -> int:
+    """
+    Description:
+    ------------
+    Convert a sequencer to a comparable integer. Integer comparison matches the documented comparison of
+    sequencers left-padded with zeros to the same length.
+
+    Parameters:
+    -----------
+    :param sequencer: Hex string sequencer of an S3 event.
+
+    Returns:
+    --------
+    :return: Integer value of the sequencer, -1 if the sequencer is missing.
+    """
+    if not sequencer:
+        return -1
+
+    return int(sequencer, 16)
+
+
+def _decode_key(key: str) -> str:
+    """
+    Description:
+    ------------
+    URL-decode an S3 object key from an event notification. Keys with only ASCII escapes are decoded
+    with a lookup table, which is several times faster than unquote_plus for the typical '%5C' separators.
+
+    Parameters:
+    -----------
+    :param key: URL-encoded S3 object key.
+
+    Returns:
+    --------
+    :return: Decoded S3 object key.
+    """
+    decoded_key = key.replace("+", " ")
+    if "%" not in decoded_key:
+        return decoded_key
+
+    head, *segments = decoded_key.split("%")
+    parts = [head]
+    for segment in segments:
+        character = ASCII_ESCAPES.get(segment[:2])
+        # Multi-byte UTF-8 sequences and malformed escapes are left to the standard decoder
+        if character is None:
+            return unquote_plus(key)
+        parts.append(character)
+        parts.append(segment[2:])
+
+    return "".join(parts)
@@ -1,10 +1,38 @@
 """This module provides interactions with AWS"""
 
+import fnmatch
 import io
 import json
+import os
+import tempfile
+import threading
 import zipfile
+from datetime import datetime
+from itertools import islice
+from typing import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+
+from src.aws.events import deduplicate_s3_events, parse_s3_events
+from src.checksum import ObjectChecksum, sha256_stream
+from src.compression import CHUNK_SIZE, CONTENT_ENCODINGS, compress_stream, decompress_partial, decompress_stream
+
+# Maximum size of the compressed upload kept in memory before spilling to disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Objects of this size or larger are downloaded in parallel ranged parts, matching the boto3 managed transfer
+PARALLEL_DOWNLOAD_THRESHOLD = TransferConfig().multipart_threshold
+DOWNLOAD_PART_SIZE = TransferConfig().multipart_chunksize
+DOWNLOAD_WORKERS = TransferConfig().max_request_concurrency
+
+# File mode creation mask of the process, read once since it can only be read by setting it
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+# Maximum number of keys accepted by a single delete_objects call
+DELETE_BATCH_SIZE = 1000
 
 
 class AWS:
@@ -75,6 +103,19 @@ class S3(AWS):
         # Create a new S3 bucket
         self.client.create_bucket(Bucket=bucket_name)
 
+    def delete_bucket(self, bucket_name: str) -> None:
+        """
+        Description:
+        ------------
+        Delete an empty S3 bucket.
+
+        Parameters:
+        -----------
+        :param bucket_name: bucket name to be deleted.
+        """
+        # Delete the S3 bucket, it must not contain any objects
+        self.client.delete_bucket(Bucket=bucket_name)
+
     def list_buckets(self) -> list:
         """
         Description:
@@ -96,21 +137,51 @@ class S3(AWS):
 
         return bucket_names
 
-    def upload_file(self, file_name: str, bucket_name: str, object_name: str) -> None:
+    def upload_file(self, file_name: str, bucket_name: str, object_name: str, compression: str = None) -> None:
         """
         Description:
         ------------
-        Upload a file to an S3 bucket.
+        Upload a file to an S3 bucket, optionally compressing it.
 
         Parameters:
         -----------
         :param file_name: Path to the file to upload.
         :param bucket_name: Name of the bucket to upload to.
         :param object_name: S3 object name. If not specified, file_name is used.
+        :param compression: Compression algorithm ('gzip' or 'zstd'). If not specified, the file is uploaded as is.
+            The SHA-256 checksum of the stored bytes is recorded in the object metadata.
         """
         if object_name is None:
             object_name = file_name
-        self.client.upload_file(file_name, bucket_name, object_name)
+
+        # Upload the file as is if compression is not requested
+        if compression is None:
+            # Store the SHA-256 checksum so downloads can be verified
+            with open(file_name, "rb") as source:
+                extra_args = {"Metadata": {"sha256": sha256_stream(source)}}
+            self.client.upload_file(file_name, bucket_name, object_name, ExtraArgs=extra_args)
+            return
+
+        if compression not in CONTENT_ENCODINGS:
+            raise ValueError(f"Unsupported compression: {compression}. Use one of {list(CONTENT_ENCODINGS)}.")
+
+        # Compress the file into a spooled buffer, large files are moved to disk
+        with open(file_name, "rb") as source, tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+            compress_stream(source, buffer, compression)
+            buffer.seek(0)
+            sha256 = sha256_stream(buffer)
+            buffer.seek(0)
+
+            # Record the encoding so downloads can decompress the object transparently
+            extra_args = {
+                "ContentEncoding": CONTENT_ENCODINGS[compression],
+                "Metadata": {
+                    "compression": compression,
+                    "uncompressed-size": str(os.path.getsize(file_name)),
+                    "sha256": sha256,
+                },
+            }
+            self.client.upload_fileobj(buffer, bucket_name, object_name, ExtraArgs=extra_args)
 
     def list_files(self, bucket_name: str) -> list:
         """
@@ -126,17 +197,167 @@ class S3(AWS):
         --------
         :return: List of file names in the bucket.
         """
-        # Create placeholder for file names
-        file_names = []
+        # Get the keys of all objects in the bucket
+        file_names = [obj["Key"] for obj in self.iter_objects(bucket_name)]
 
-        # List objects in the specified S3 bucket
-        response = self.client.list_objects_v2(Bucket=bucket_name)
+        return file_names
 
-        # Check if 'Contents' is in the response and return the list of file names
-        if "Contents" in response:
-            file_names = [obj["Key"] for obj in response["Contents"]]
+    def iter_objects(self, bucket_name: str, prefix: str = "") -> Iterator[dict]:
+        """
+        Description:
+        ------------
+        Iterate over objects in an S3 bucket, following pagination.
 
-        return file_names
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to list objects from.
+        :param prefix: Only objects with keys starting with this prefix are listed.
+
+        Returns:
+        --------
+        :return: Iterator of object descriptions with 'Key', 'Size', 'ETag' and 'LastModified' keys.
+        """
+        # Pages are fetched lazily, so callers can start processing before the listing ends
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            yield from page.get("Contents", [])
+
+    def delete_objects(self, bucket_name: str, object_names: list) -> list:
+        """
+        Description:
+        ------------
+        Delete objects from an S3 bucket with a single batch request.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to delete objects from.
+        :param object_names: S3 object names to delete, at most 1000.
+
+        Returns:
+        --------
+        :return: List of errors with 'Key', 'Code' and 'Message' keys for objects which could not be deleted.
+        """
+        # Quiet mode returns only the objects which failed to delete
+        try:
+            response = self.client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": object_name} for object_name in object_names], "Quiet": True},
+            )
+        except self.client.exceptions.ClientError as error:
+            # Failed request is reported for every object of the batch, so other batches can continue
+            code = error.response["Error"].get("Code")
+            message = error.response["Error"].get("Message", str(error))
+            return [{"Key": object_name, "Code": code, "Message": message} for object_name in object_names]
+
+        return response.get("Errors", [])
+
+    def iter_matching_objects(
+        self, bucket_name: str, prefix: str = "", older_than: datetime = None, pattern: str = None
+    ) -> Iterator[dict]:
+        """
+        Description:
+        ------------
+        Iterate over the objects of an S3 bucket matching the given filters.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to list.
+        :param prefix: Only objects with keys starting with this prefix are returned.
+        :param older_than: Only objects last modified before this timezone aware datetime are returned.
+        :param pattern: Only objects with keys matching this glob pattern are returned.
+
+        Returns:
+        --------
+        :return: Iterator of object descriptions with 'Key', 'Size', 'ETag' and 'LastModified' keys.
+        """
+        # Filter the paginated listing while it is streamed
+        for obj in self.iter_objects(bucket_name, prefix=prefix):
+            if (older_than is None or obj["LastModified"] < older_than) and (
+                pattern is None or fnmatch.fnmatchcase(obj["Key"], pattern)
+            ):
+                yield obj
+
+    def delete_files(
+        self,
+        bucket_name: str,
+        prefix: str = "",
+        older_than: datetime = None,
+        pattern: str = None,
+        workers: int = 4,
+    ) -> tuple:
+        """
+        Description:
+        ------------
+        Delete files from an S3 bucket matching the given filters in parallel batches.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to delete files from.
+        :param prefix: Only objects with keys starting with this prefix are deleted.
+        :param older_than: Only objects last modified before this timezone aware datetime are deleted.
+        :param pattern: Only objects with keys matching this glob pattern are deleted.
+        :param workers: Number of concurrent delete_objects requests.
+
+        Returns:
+        --------
+        :return: Tuple of the number of matching objects and the list of errors for objects which could not be deleted.
+        """
+        # Stream matching keys from the paginated listing
+        object_names = (obj["Key"] for obj in self.iter_matching_objects(bucket_name, prefix, older_than, pattern))
+
+        # Create placeholders for statistics
+        matched_count = 0
+        errors = []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            while batch := list(islice(object_names, DELETE_BATCH_SIZE)):
+                matched_count += len(batch)
+                pending.add(executor.submit(self.delete_objects, bucket_name, batch))
+                # Limit the number of batches in flight to keep memory usage bounded
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        errors += future.result()
+            for future in pending:
+                errors += future.result()
+
+        return matched_count, errors
+
+    def put_expiration_rule(self, bucket_name: str, rule_id: str, expiration_days: int, prefix: str = "") -> None:
+        """
+        Description:
+        ------------
+        Add or replace a lifecycle rule which expires objects server-side.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to configure.
+        :param rule_id: Identifier of the lifecycle rule. An existing rule with the same identifier is replaced.
+        :param expiration_days: Number of days after creation when objects expire.
+        :param prefix: Only objects with keys starting with this prefix expire.
+        """
+        # Get existing rules, the configuration is replaced as a whole
+        try:
+            rules = self.client.get_bucket_lifecycle_configuration(Bucket=bucket_name)["Rules"]
+        except self.client.exceptions.ClientError as error:
+            if error.response["Error"]["Code"] != "NoSuchLifecycleConfiguration":
+                raise
+            rules = []
+
+        # Replace the rule with the same identifier
+        rules = [rule for rule in rules if rule.get("ID") != rule_id]
+        rules.append(
+            {
+                "ID": rule_id,
+                "Filter": {"Prefix": prefix},
+                "Status": "Enabled",
+                "Expiration": {"Days": expiration_days},
+                "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": expiration_days},
+            }
+        )
+
+        self.client.put_bucket_lifecycle_configuration(Bucket=bucket_name, LifecycleConfiguration={"Rules": rules})
 
     def lambda_invoke(self, bucket_name: str, lambda_arn: str) -> None:
         """
@@ -157,19 +378,347 @@ class S3(AWS):
             },
         )
 
-    def download_file(self, bucket_name: str, object_name: str, download_path: str) -> None:
+    def download_file(
+        self, bucket_name: str, object_name: str, download_path: str, chunk_size: int = CHUNK_SIZE, verify: bool = True
+    ) -> None:
         """
         Description:
         ------------
-        Download a file from an S3 bucket.
+        Download a file from an S3 bucket, decompressing it if it was uploaded compressed.
+
+        The object is streamed into a '.part' file next to download_path, verified against its stored
+        SHA-256 checksum or ETag and then renamed into place, so download_path never holds a truncated file.
+        If a '.part' file is left from an interrupted download, only the missing bytes are requested, provided
+        the object still has the ETag recorded in the '.part.etag' file; otherwise, it is downloaded from scratch.
+        Uncompressed objects of at least PARALLEL_DOWNLOAD_THRESHOLD bytes are fetched in parallel ranged parts
+        instead, the finished parts are recorded in the '.part.parts' file so only the missing parts are resumed.
 
         Parameters:
         -----------
         :param bucket_name: Name of the bucket to download from.
         :param object_name: S3 object name to download.
         :param download_path: Path to save the downloaded file.
+        :param chunk_size: Size of the chunks read from the response and written to disk.
+        :param verify: If True, verifies the checksum of the downloaded bytes.
+        """
+        part_path = f"{download_path}.part"
+        etag_path = f"{part_path}.etag"
+        parts_path = f"{part_path}.parts"
+
+        # Resume from the bytes already downloaded by an earlier attempt of the same object version
+        offset = 0
+        etag = None
+        if os.path.exists(part_path) and os.path.exists(etag_path):
+            offset = os.path.getsize(part_path)
+            with open(etag_path, "r") as f:
+                etag = f.read().strip()
+
+        # Parallel download writes its parts out of order, so it is resumed by part instead of by offset
+        resume_parts = False
+        if etag and os.path.exists(parts_path):
+            response = self.client.head_object(Bucket=bucket_name, Key=object_name)
+            resume_parts = response["ETag"] == etag
+            offset = 0
+        if not resume_parts:
+            response, offset = self.__get_object_from(bucket_name, object_name, offset, etag)
+
+        # Partial file without a matching ETag cannot be resumed
+        if not offset and not resume_parts:
+            self.__remove_files(part_path, etag_path, parts_path)
+            # Record the ETag before any bytes are written, so an interrupted download can be resumed
+            with open(etag_path, "w") as f:
+                f.write(response["ETag"])
+
+        checksum = self.__create_checksum(bucket_name, object_name, response) if verify else None
+        content_encoding = self.__get_content_encoding(response)
+
+        # Large uncompressed objects are downloaded in parallel ranged parts
+        if not offset and not content_encoding and response.get("ContentLength", 0) >= PARALLEL_DOWNLOAD_THRESHOLD:
+            if response.get("Body") is not None:
+                response["Body"].close()
+            self.__download_parts(bucket_name, object_name, part_path, parts_path, response, chunk_size)
+            # Hash the downloaded file, the parts are not written in order
+            if checksum is not None:
+                with open(part_path, "rb") as part:
+                    while chunk := part.read(chunk_size):
+                        checksum.update(chunk)
+        else:
+            with open(part_path, "ab") as f:
+                # Hash the bytes downloaded by the earlier attempt
+                if checksum is not None and offset:
+                    with open(part_path, "rb") as part:
+                        while chunk := part.read(chunk_size):
+                            checksum.update(chunk)
+                # Stream the remaining bytes to disk
+                body = response.get("Body")
+                for chunk in body.iter_chunks(chunk_size) if body is not None else []:
+                    f.write(chunk)
+                    if checksum is not None:
+                        checksum.update(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+
+        if checksum is not None and not checksum.verify():
+            self.__remove_files(part_path, etag_path, parts_path)
+            # Partial file may have been damaged locally, so retry once from scratch
+            if offset or resume_parts:
+                return self.download_file(bucket_name, object_name, download_path, chunk_size, verify)
+            raise ValueError(f"Checksum mismatch for s3://{bucket_name}/{object_name}.")
+
+        if content_encoding in CONTENT_ENCODINGS.values():
+            # Decompress into a temporary file in the same directory so the rename stays atomic
+            with open(part_path, "rb") as source, tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(os.path.abspath(download_path)), delete=False
+            ) as destination:
+                try:
+                    decompress_stream(source, destination, content_encoding)
+                    # Make sure the data is on disk before the rename makes it visible
+                    destination.flush()
+                    os.fsync(destination.fileno())
+                except Exception:
+                    destination.close()
+                    os.remove(destination.name)
+                    raise
+            # Temporary files are private, so apply the permissions a regular new file would get
+            os.chmod(destination.name, 0o666 & ~UMASK)
+            os.replace(destination.name, download_path)
+            self.__remove_files(part_path, etag_path, parts_path)
+        else:
+            os.replace(part_path, download_path)
+            self.__remove_files(etag_path, parts_path)
+
+    def __download_parts(
+        self, bucket_name: str, object_name: str, part_path: str, parts_path: str, response: dict, chunk_size: int
+    ) -> None:
         """
-        self.client.download_file(bucket_name, object_name, download_path)
+        Description:
+        ------------
+        Download the parts of an S3 object missing from the '.part' file with parallel ranged requests.
+
+        Each part is requested only if the object still has the ETag of the response and is written at its
+        offset. Finished parts are appended to the parts file, so an interrupted download fetches only the
+        missing parts. If the object changes meanwhile, the error is raised and the next call starts from scratch.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to download from.
+        :param object_name: S3 object name to download.
+        :param part_path: Path to the '.part' file the parts are written to.
+        :param parts_path: Path to the file recording the finished part numbers.
+        :param response: Response of the get_object or head_object call of the object.
+        :param chunk_size: Size of the chunks read from the response and written to disk.
+        """
+        size = response["ContentLength"]
+        etag = response["ETag"]
+
+        # Skip the parts finished by an earlier attempt
+        finished = set()
+        if os.path.exists(parts_path):
+            with open(parts_path, "r") as f:
+                finished = {int(line) for line in f if line.strip()}
+        missing = [number for number in range(-(-size // DOWNLOAD_PART_SIZE)) if number not in finished]
+
+        # Allocate the whole file, so each part can be written at its offset
+        with open(part_path, "r+b" if os.path.exists(part_path) else "wb") as f:
+            f.truncate(size)
+
+        lock = threading.Lock()
+
+        def download_part(number: int) -> None:
+            start = number * DOWNLOAD_PART_SIZE
+            end = min(start + DOWNLOAD_PART_SIZE, size) - 1
+            part = self.client.get_object(
+                Bucket=bucket_name, Key=object_name, Range=f"bytes={start}-{end}", IfMatch=etag
+            )
+            with open(part_path, "r+b") as f:
+                f.seek(start)
+                for chunk in part["Body"].iter_chunks(chunk_size):
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            # Record the part only after its bytes are on disk
+            with lock, open(parts_path, "a") as f:
+                f.write(f"{number}\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            # Consume the results to raise the first failed part
+            list(executor.map(download_part, missing))
+
+    def __get_object_from(self, bucket_name: str, object_name: str, offset: int, etag: str = None) -> tuple:
+        """
+        Description:
+        ------------
+        Get an S3 object starting at the given byte offset if it still has the given ETag.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to download from.
+        :param object_name: S3 object name to download.
+        :param offset: Number of bytes to skip from the start of the object.
+        :param etag: ETag of the object version the skipped bytes belong to.
+
+        Returns:
+        --------
+        :return: Tuple of the response and the offset it starts at. The response is from the head_object call
+            without 'Body' if nothing is left. Offset is 0 if the object changed since the bytes were skipped.
+        """
+        if not offset:
+            return self.client.get_object(Bucket=bucket_name, Key=object_name), 0
+
+        try:
+            response = self.client.get_object(
+                Bucket=bucket_name, Key=object_name, Range=f"bytes={offset}-", IfMatch=etag
+            )
+            return response, offset
+        except self.client.exceptions.ClientError as error:
+            code = error.response["Error"]["Code"]
+            if code in ("PreconditionFailed", "412"):
+                # Object changed since the earlier attempt, so it is downloaded from scratch
+                return self.client.get_object(Bucket=bucket_name, Key=object_name), 0
+            if code != "InvalidRange":
+                raise
+
+        # Offset is at the end of the object, so only its metadata is needed
+        try:
+            return self.client.head_object(Bucket=bucket_name, Key=object_name, IfMatch=etag), offset
+        except self.client.exceptions.ClientError as error:
+            if error.response["Error"]["Code"] not in ("PreconditionFailed", "412"):
+                raise
+            return self.client.get_object(Bucket=bucket_name, Key=object_name), 0
+
+    def __remove_files(self, *paths: str) -> None:
+        """
+        Description:
+        ------------
+        Remove files if they exist.
+
+        Parameters:
+        -----------
+        :param paths: Paths of the files to remove.
+        """
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def __create_checksum(self, bucket_name: str, object_name: str, response: dict) -> ObjectChecksum:
+        """
+        Description:
+        ------------
+        Create the checksum used to verify a downloaded S3 object.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket the object is downloaded from.
+        :param object_name: S3 object name.
+        :param response: Response of the get_object or head_object call.
+
+        Returns:
+        --------
+        :return: Object checksum, or None if the object cannot be verified.
+        """
+        # SHA-256 checksum recorded on upload takes precedence over the ETag
+        sha256 = response.get("Metadata", {}).get("sha256")
+        if sha256:
+            return ObjectChecksum(response["ETag"], sha256=sha256)
+
+        # ETag of objects encrypted with KMS, DSSE-KMS or customer keys is not an MD5 digest
+        if response.get("ServerSideEncryption") in ("aws:kms", "aws:kms:dsse") or response.get("SSECustomerAlgorithm"):
+            return None
+
+        etag = response["ETag"].strip('"')
+        if "-" not in etag:
+            return ObjectChecksum(etag)
+
+        # Multipart ETag can only be verified with the size of the uploaded parts
+        first_part = self.client.head_object(Bucket=bucket_name, Key=object_name, PartNumber=1)
+        part_size = first_part["ContentLength"]
+
+        # Only parts of equal size can be reproduced from the first one, other uploads are not verified
+        parts_count = int(etag.rsplit("-", 1)[1])
+        content_range = response.get("ContentRange")
+        size = int(content_range.rsplit("/", 1)[1]) if content_range else response["ContentLength"]
+        if not part_size or -(-size // part_size) != parts_count:
+            return None
+        if first_part.get("PartsCount", parts_count) != parts_count:
+            return None
+        # Last part holds the remainder only if the parts before it are all of the first part size
+        if parts_count > 1:
+            last_part = self.client.head_object(Bucket=bucket_name, Key=object_name, PartNumber=parts_count)
+            if last_part["ContentLength"] != size - (parts_count - 1) * part_size:
+                return None
+
+        return ObjectChecksum(etag, part_size=part_size)
+
+    def read_file(self, bucket_name: str, object_name: str) -> bytes:
+        """
+        Description:
+        ------------
+        Read the content of a file from an S3 bucket.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to read from.
+        :param object_name: S3 object name to read.
+
+        Returns:
+        --------
+        :return: Uncompressed content of the file.
+        """
+        # Get the object and decompress it in memory
+        response = self.client.get_object(Bucket=bucket_name, Key=object_name)
+        content = io.BytesIO()
+        decompress_stream(response["Body"], content, self.__get_content_encoding(response))
+
+        return content.getvalue()
+
+    def read_file_header(self, bucket_name: str, object_name: str, header_bytes: int = 2048) -> bytes:
+        """
+        Description:
+        ------------
+        Read the beginning of a file from an S3 bucket with a ranged request.
+
+        Parameters:
+        -----------
+        :param bucket_name: Name of the bucket to read from.
+        :param object_name: S3 object name to read.
+        :param header_bytes: Number of stored bytes to request from the start of the object.
+
+        Returns:
+        --------
+        :return: Uncompressed beginning of the file, empty for empty objects. Compressed objects may decode to
+            more than header_bytes.
+        """
+        # Request only the first bytes of the object
+        try:
+            response = self.client.get_object(Bucket=bucket_name, Key=object_name, Range=f"bytes=0-{header_bytes - 1}")
+        except self.client.exceptions.ClientError as error:
+            # Range of an empty object cannot be satisfied
+            if error.response["Error"]["Code"] != "InvalidRange":
+                raise
+            return b""
+        data = response["Body"].read()
+
+        return decompress_partial(data, self.__get_content_encoding(response))
+
+    def __get_content_encoding(self, response: dict) -> str:
+        """
+        Description:
+        ------------
+        Get the compression of an S3 object from its Content-Encoding or metadata.
+
+        Parameters:
+        -----------
+        :param response: Response of the get_object or head_object call.
+
+        Returns:
+        --------
+        :return: Content encoding of the object, empty string for uncompressed objects.
+        """
+        content_encoding = response.get("ContentEncoding") or response.get("Metadata", {}).get("compression", "")
+
+        return content_encoding.lower()
 
 
 class CloudWatch(AWS):
@@ -242,7 +791,7 @@ class CloudWatch(AWS):
 
         Returns:
         --------
-        :return: List of log events containing GPX files.
+        :return: List of S3 events for GPX files, one per object.
         """
         # Multiply events_count by 4 to ensure we get enough events
         events_count *= 4
@@ -258,10 +807,10 @@ class CloudWatch(AWS):
             print(f"No log events found in stream {log_stream_name} of group {log_group_name}.")
             return []
 
-        # Create a placeholder for GPS files
-        gps_files = []
+        # Create a placeholder for S3 events
+        s3_events = []
 
-        # Iterate over the events and extract GPS files
+        # Iterate over the events and extract GPX file notifications
         for event in events:
             # Get the event message
             event_message = event.get("message", "")
@@ -270,24 +819,10 @@ class CloudWatch(AWS):
                 continue
             # Check if the event message contains a GPX file
             if "route_framed_synced.gpx" in event_message:
-                # Parse the JSON data from the event message
-                json_data = json.loads(event_message)
-                # Get the records from the JSON data
-                records = json_data.get("Records", [])
-                # Iterate over the records and extract GPX files
-                for record in records:
-                    # Get the S3 bucket name
-                    s3_bucket = record["s3"]["bucket"]["name"]
-                    # Get the S3 object key (file name)
-                    s3_key = record["s3"]["object"]["key"]
-                    # Parse the S3 key to define correctly formatted file name
-                    s3_key = s3_key.replace("%5C", "\\")
-                    # Get the event timestamp
-                    event_timestamp = record["eventTime"]
-                    # Create a dictionary with GPX file information
-                    gps_files.append(({"bucket": s3_bucket, "filename": s3_key, "event_timestamp": event_timestamp}))
-
-        return gps_files
+                s3_events += parse_s3_events(event_message)
+
+        # Collapse repeated notifications for the same object before any download is scheduled
+        return deduplicate_s3_events(s3_events)
 
     def create_log_stream(self, log_group_name: str, log_stream_name: str) -> None:
         """
@@ -0,0 +1,87 @@
+"""Local SQLite catalogue of GPX files stored in S3."""
+
+import sqlite3
+
+CREATE_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS gpx_catalogue (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT,
+    time TEXT,
+    creator TEXT,
+    description TEXT,
+    size INTEGER,
+    etag TEXT,
+    indexed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (bucket, key)
+)
+"""
+
+UPSERT_QUERY = """
+INSERT INTO gpx_catalogue (bucket, key, name, time, creator, description, size, etag)
+VALUES (:bucket, :key, :name, :time, :creator, :description, :size, :etag)
+ON CONFLICT (bucket, key) DO UPDATE SET
+    name = excluded.name,
+    time = excluded.time,
+    creator = excluded.creator,
+    description = excluded.description,
+    size = excluded.size,
+    etag = excluded.etag,
+    indexed_at = CURRENT_TIMESTAMP
+"""
+
+
+def open_catalogue(catalogue_path: str) -> sqlite3.Connection:
+    """
+    Description
+    ----------
+    Open the SQLite catalogue, creating the table if it does not exist.
+
+    Parameters
+    ----------
+    :param catalogue_path: Path to the SQLite database file.
+
+    Returns
+    -------
+    :return: Connection to the catalogue database.
+    """
+    connection = sqlite3.connect(catalogue_path)
+    connection.execute(CREATE_TABLE_QUERY)
+    connection.commit()
+
+    return connection
+
+
+def get_indexed_etags(connection: sqlite3.Connection, bucket_name: str) -> dict:
+    """
+    Description
+    ----------
+    Get the ETags of the catalogued objects of a bucket.
+
+    Parameters
+    ----------
+    :param connection: Connection to the catalogue database.
+    :param bucket_name: Name of the bucket.
+
+    Returns
+    -------
+    :return: Dictionary mapping object keys to their catalogued ETags.
+    """
+    rows = connection.execute("SELECT key, etag FROM gpx_catalogue WHERE bucket = ?", (bucket_name,))
+
+    return dict(rows.fetchall())
+
+
+def save_entries(connection: sqlite3.Connection, entries: list) -> None:
+    """
+    Description
+    ----------
+    Insert or update catalogue entries in a single transaction.
+
+    Parameters
+    ----------
+    :param connection: Connection to the catalogue database.
+    :param entries: List of dictionaries with the catalogue table columns.
+    """
+    with connection:
+        connection.executemany(UPSERT_QUERY, entries)
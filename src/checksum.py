@@ -0,0 +1,102 @@
+"""Incremental checksum verification for objects downloaded from S3."""
+
+import hashlib
+from typing import BinaryIO
+
+# Size of the chunks read when hashing files
+CHUNK_SIZE = 1024 * 1024
+
+
+def sha256_stream(source: BinaryIO) -> str:
+    """
+    Description
+    ----------
+    Compute the SHA-256 checksum of a binary stream chunk by chunk.
+
+    Parameters
+    ----------
+    :param source: Readable binary stream.
+
+    Returns
+    -------
+    :return: Hex encoded SHA-256 checksum.
+    """
+    digest = hashlib.sha256()
+    while chunk := source.read(CHUNK_SIZE):
+        digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+class ObjectChecksum:
+    def __init__(self, etag: str, part_size: int = None, sha256: str = None):
+        """
+        Description
+        ----------
+        Initialize the checksum of an S3 object which is updated while its bytes are streamed.
+
+        Parameters
+        ----------
+        :param etag: ETag of the object. Multipart ETags have a '-<parts>' suffix.
+        :param part_size: Size of the multipart upload parts. Required to verify multipart ETags.
+        :param sha256: Hex encoded SHA-256 checksum stored with the object. Takes precedence over the ETag.
+        """
+        self.etag = etag.strip('"').lower()
+        self.part_size = part_size
+        self.sha256 = sha256.lower() if sha256 else None
+
+        # Multipart ETag is the MD5 of the concatenated part MD5 digests
+        self.multipart = "-" in self.etag
+        self.part_digests = []
+        self.part_remaining = part_size
+
+        self.digest = hashlib.sha256() if self.sha256 else hashlib.md5()
+
+    def update(self, chunk: bytes) -> None:
+        """
+        Description
+        ----------
+        Add the next bytes of the object to the checksum.
+
+        Parameters
+        ----------
+        :param chunk: Next bytes of the object.
+        """
+        if self.sha256 or not self.multipart:
+            self.digest.update(chunk)
+            return
+
+        # Split the chunk at part boundaries and start a new digest for every part
+        while chunk:
+            part_chunk, chunk = chunk[: self.part_remaining], chunk[self.part_remaining :]
+            self.digest.update(part_chunk)
+            self.part_remaining -= len(part_chunk)
+            if self.part_remaining == 0:
+                self.part_digests.append(self.digest.digest())
+                self.digest = hashlib.md5()
+                self.part_remaining = self.part_size
+
+    def verify(self) -> bool:
+        """
+        Description
+        ----------
+        Check if the streamed bytes match the stored checksum.
+
+        Returns
+        -------
+        :return: True if the checksum matches; otherwise, False.
+        """
+        if self.sha256:
+            return self.digest.hexdigest() == self.sha256
+
+        if not self.multipart:
+            return self.digest.hexdigest() == self.etag
+
+        # Add the last incomplete part
+        part_digests = list(self.part_digests)
+        if self.part_remaining != self.part_size:
+            part_digests.append(self.digest.digest())
+
+        multipart_etag = f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+
+        return multipart_etag == self.etag
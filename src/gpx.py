@@ -0,0 +1,65 @@
+"""Parsing helpers for GPX files."""
+
+import xml.etree.ElementTree as ET
+
+
+def _local_name(tag: str) -> str:
+    """
+    Description
+    ----------
+    Strip the XML namespace from a tag name.
+
+    Parameters
+    ----------
+    :param tag: Tag name, optionally prefixed with a namespace in braces.
+
+    Returns
+    -------
+    :return: Tag name without the namespace.
+    """
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_gpx_header(data: bytes) -> dict:
+    """
+    Description
+    ----------
+    Parse the `<metadata>` block of a GPX file from its first bytes.
+
+    Parameters
+    ----------
+    :param data: Beginning of the GPX file. It does not need to be a complete XML document.
+
+    Returns
+    -------
+    :return: Dictionary with 'creator', 'name', 'time' and 'description' keys, or None if the
+        `<metadata>` block is not complete in the given data.
+    """
+    # Pull parser accepts partial documents and reports elements as soon as they are closed
+    parser = ET.XMLPullParser(events=("start", "end"))
+
+    header = {"creator": None, "name": None, "time": None, "description": None}
+    try:
+        parser.feed(data)
+        for event, element in parser.read_events():
+            tag = _local_name(element.tag)
+            if event == "start" and tag == "gpx":
+                header["creator"] = element.get("creator")
+            # Track points follow the metadata, so there is nothing more to read
+            elif event == "start" and tag in ("trk", "rte", "wpt"):
+                return header
+            elif event == "end" and tag == "metadata":
+                for child in element:
+                    child_tag = _local_name(child.tag)
+                    if child_tag == "name":
+                        header["name"] = child.text
+                    elif child_tag == "time":
+                        header["time"] = child.text
+                    elif child_tag == "desc":
+                        header["description"] = child.text
+                return header
+    except ET.ParseError:
+        # Truncated multi-byte characters or malformed data cannot be parsed further
+        pass
+
+    return None